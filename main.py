@@ -1,18 +1,25 @@
 from ipaddress import ip_address
-from typing import Callable
 import re
 
 
-from fastapi import FastAPI, Depends, HTTPException, Request, status
+import uvloop
+
+
+uvloop.install()
+
+
+from fastapi import FastAPI, Depends, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi.responses import JSONResponse
 from fastapi_limiter import FastAPILimiter
 import redis.asyncio as redis
 from sqlalchemy import text
 
 
 from src.customs.custom_logger import logger
+from src.database.cache import pool as redis_pool
 from src.routes import user_profile
 from src.database.db import get_db
 from src.config.conf import config
@@ -20,12 +27,15 @@ from src.routes import users
 from src.routes import auth
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
-banned_ips = [
-    ip_address("192.168.1.1"),
-]
+BANNED_IPS: frozenset[int] = frozenset(
+    int(ip_address(addr))
+    for addr in (
+        "192.168.1.1",
+    )
+)
 
 
 origins = ["*"]
@@ -40,20 +50,93 @@ app.add_middleware(
 )
 
 
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
 user_agent_ban_list = [r"Python-urllib"]
 
 
-@app.middleware("http")
-async def user_agent_ban_middleware(request: Request, call_next: Callable):
-    user_agent = request.headers.get("user-agent")
-    for ban_pattern in user_agent_ban_list:
-        if re.search(ban_pattern, user_agent):
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={"detail": "You are banned"},
-            )
-    response = await call_next(request)
-    return response
+ban_pattern = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in user_agent_ban_list)
+)
+ban_pattern_bytes = re.compile(ban_pattern.pattern.encode("latin-1"))
+
+
+BAN_RESPONSE_BODY = b'{"detail":"You are banned"}'
+INDEX_RESPONSE_BODY = b'{"message":"Todo Application"}'
+HEALTH_OK_RESPONSE_BODY = b'{"message":"Welcome to FastAPI!"}'
+
+
+class UserAgentBanMiddleware:
+    """
+    Pure ASGI middleware that rejects requests from banned user agents.
+
+    Unlike an `@app.middleware("http")` function, this avoids the
+    `BaseHTTPMiddleware` wrapper, which spawns an extra task and builds a
+    `Request` object for every request just to read one header.
+
+    Args:
+        app: The downstream ASGI application.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        """
+        Checks the user-agent header and short-circuits banned clients.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        client = scope.get("client")
+        if client is not None:
+            try:
+                if int(ip_address(client[0])) in BANNED_IPS:
+                    await self._send_ban(send)
+                    return
+            except ValueError:
+                pass
+        user_agent = None
+        for name, value in scope["headers"]:
+            if name == b"user-agent":
+                user_agent = value
+                break
+        if user_agent is not None and ban_pattern_bytes.search(user_agent):
+            await self._send_ban(send)
+            return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _send_ban(send) -> None:
+        """
+        Sends the pre-encoded 403 ban response.
+
+        Args:
+            send: The ASGI send callable.
+        """
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_403_FORBIDDEN,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (
+                        b"content-length",
+                        str(len(BAN_RESPONSE_BODY)).encode("latin-1"),
+                    ),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": BAN_RESPONSE_BODY})
+
+
+app.add_middleware(UserAgentBanMiddleware)
 
 
 app.include_router(auth.router, prefix="/api")
@@ -61,27 +144,35 @@ app.include_router(user_profile.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
 
 
+# Compose the ASGI middleware chain once at import time instead of leaving it
+# to be built lazily on the first request.
+app.middleware_stack = app.build_middleware_stack()
+
+
 @app.on_event("startup")
 async def startup():
-    r = await redis.Redis(
-        host=config.REDIS_DOMAIN,
-        port=config.REDIS_PORT,
-        db=0,
-        password=config.REDIS_PASSWORD,
-    )
+    app.state.redis_pool = redis_pool
+    r = redis.Redis(connection_pool=redis_pool)
     await FastAPILimiter.init(r)
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    pool = getattr(app.state, "redis_pool", None)
+    if pool is not None:
+        await pool.disconnect()
+
+
 @app.get("/")
-def index() -> dict:
+def index() -> Response:
     """
     Main endpoint returning a message indicating the Todo Application.
     """
-    return {"message": "Todo Application"}
+    return Response(INDEX_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/api/healthchecker")
-async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
+async def healthchecker(db: AsyncSession = Depends(get_db)) -> Response:
     """
     Endpoint for checking the health of the application and database connection.
 
@@ -89,7 +180,7 @@ async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
         db (AsyncSession): An asynchronous database session.
 
     Returns:
-        dict: A message indicating the status of the application and database connection.
+        Response: A message indicating the status of the application and database connection.
     """
     try:
         result = await db.execute(text("SELECT 1"))
@@ -98,7 +189,7 @@ async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
             raise HTTPException(
                 status_code=500, detail="Database is not configured correctly"
             )
-        return {"message": "Welcome to FastAPI!"}
+        return Response(HEALTH_OK_RESPONSE_BODY, media_type="application/json")
     except Exception as e:
         logger.log(e, level=40)
         raise HTTPException(status_code=500, detail="Error connecting to the database")
@@ -0,0 +1,24 @@
+import redis.asyncio as redis
+
+
+from src.config.conf import config
+
+
+pool = redis.ConnectionPool(
+    host=config.REDIS_DOMAIN,
+    port=config.REDIS_PORT,
+    db=0,
+    password=config.REDIS_PASSWORD,
+    max_connections=64,
+    decode_responses=False,
+)
+
+
+def get_redis() -> redis.Redis:
+    """
+    Returns a Redis client backed by the shared connection pool.
+
+    Returns:
+        redis.Redis: An asynchronous Redis client.
+    """
+    return redis.Redis(connection_pool=pool)
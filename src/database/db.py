@@ -1,10 +1,5 @@
 from typing import AsyncGenerator, Optional
 import contextlib
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
 from sqlalchemy.ext.asyncio import (
@@ -15,8 +10,8 @@ from sqlalchemy.ext.asyncio import (
 )
 
 
-from customs.custom_logger import logger
-from config.conf import config
+from src.customs.custom_logger import logger
+from src.config.conf import config
 
 
 class DatabaseSessionManager:
@@ -32,9 +27,21 @@ class DatabaseSessionManager:
     """
 
     def __init__(self, url: str):
-        self._engine: Optional[AsyncEngine] = create_async_engine(url)
+        self._engine: Optional[AsyncEngine] = create_async_engine(
+            url,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+            query_cache_size=1024,
+            connect_args={
+                "prepared_statement_cache_size": 500,
+                "server_settings": {"jit": "off"},
+            },
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            bind=self._engine, expire_on_commit=False, autoflush=False
         )
 
     @contextlib.asynccontextmanager
@@ -63,12 +70,29 @@ class DatabaseSessionManager:
 sessionmanager = DatabaseSessionManager(config.DB_URL)
 
 
+def get_session_factory():
+    """
+    Returns the factory used to open sessions outside the request one.
+
+    Endpoints that fan out concurrent queries depend on this instead of
+    reaching for the session manager directly, so tests can override it.
+
+    Returns:
+        Callable: A callable yielding an async session context manager.
+    """
+    return sessionmanager.session
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Asynchronously yields a database session.
+    Asynchronously yields a database session wrapped in one transaction.
+
+    The transaction commits when the request finishes and rolls back if the
+    request raises, so repository functions never need to commit themselves.
 
     Yields:
         AsyncSession: The database session.
     """
     async with sessionmanager.session() as session:
-        yield session
+        async with session.begin():
+            yield session
@@ -1,17 +1,12 @@
 import asyncio
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
 from sqlalchemy.ext.asyncio import create_async_engine
 
 
-from customs.custom_logger import logger
-from config.conf import config
-from models import Base
+from src.customs.custom_logger import logger
+from src.config.conf import config
+from src.entity.models import Base
 
 
 engine = create_async_engine(config.DB_URL)
@@ -2,7 +2,16 @@ from datetime import date, datetime
 import enum
 
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey, func, Enum, Boolean
+from sqlalchemy import (
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    func,
+    Enum,
+    Boolean,
+    Index,
+)
 from sqlalchemy.orm import Mapped, mapped_column, DeclarativeBase, relationship
 
 
@@ -30,6 +39,10 @@ class User(Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_consumer_birth", "consumer_id", "birth_date"),
+        Index("ix_users_consumer_id", "consumer_id", "id"),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     first_name: Mapped[str] = mapped_column(String(50), index=True)
     second_name: Mapped[str] = mapped_column(String(50), index=True)
@@ -47,7 +60,7 @@ class User(Base):
         Integer, ForeignKey("consumers.id"), nullable=True
     )
     consumer: Mapped["Consumer"] = relationship(
-        "Consumer", backref="users", lazy="joined"
+        "Consumer", backref="users", lazy="selectin"
     )
 
 
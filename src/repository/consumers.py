@@ -1,21 +1,50 @@
 from typing import Optional
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from libgravatar import Gravatar
-from sqlalchemy import select
+from sqlalchemy import select, update
 from fastapi import Depends
 
 
-from customs.custom_logger import logger
-from schemas.consumer import UserSchema
-from entity.models import Consumer
-from database.db import get_db
+from src.customs.custom_logger import logger
+from src.schemas.consumer import UserSchema
+from src.database.cache import get_redis
+from src.entity.models import Consumer
+from src.database.db import get_db
+
+
+CONSUMER_CACHE_TTL = 30
+
+
+def _consumer_cache_key(email: str) -> str:
+    """
+    Builds the Redis key under which a consumer is cached.
+
+    Args:
+        email (str): The email address of the consumer.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"consumer:{email}"
+
+
+async def invalidate_user_cache(email: str) -> None:
+    """
+    Drops the cached copies of a consumer after a write.
+
+    Both the repository-level consumer:<email> key and the auth service's
+    bare <email> key are removed so no stale copy outlives a mutation.
+
+    Args:
+        email (str): The email address of the consumer.
+    """
+    try:
+        await get_redis().delete(_consumer_cache_key(email), email)
+    except Exception as err:
+        logger.log(err, level=40)
 
 
 async def get_user_by_email(
@@ -31,10 +60,42 @@ async def get_user_by_email(
     Returns:
         Optional[Consumer]: The user retrieved from the database, or None if not found.
     """
-    async with db as session:
-        stmt = select(Consumer).filter_by(email=email)
-        user = await session.execute(stmt)
-        return user.scalar_one_or_none()
+    stmt = select(Consumer).filter_by(email=email)
+    user = await db.execute(stmt)
+    return user.scalar_one_or_none()
+
+
+async def get_user_by_email_cached(
+    email: str, db: AsyncSession = Depends(get_db)
+) -> Optional[Consumer]:
+    """
+    Retrieves a user by email, serving repeat lookups from Redis.
+
+    Args:
+        email (str): The email address of the user.
+        db (AsyncSession, optional): The asynchronous database session.
+
+    Returns:
+        Optional[Consumer]: The user retrieved from cache or database.
+    """
+    # Imported here because src.services.auth imports this module at load time
+    from src.services.auth import deserialize_consumer, serialize_consumer
+
+    cache = get_redis()
+    key = _consumer_cache_key(email)
+    try:
+        cached = await cache.get(key)
+        if cached is not None:
+            return deserialize_consumer(cached)
+    except Exception as err:
+        logger.log(err, level=40)
+    user = await get_user_by_email(email, db)
+    if user is not None:
+        try:
+            await cache.set(key, serialize_consumer(user), ex=CONSUMER_CACHE_TTL)
+        except Exception as err:
+            logger.log(err, level=40)
+    return user
 
 
 async def create_user(body: UserSchema, db: AsyncSession = Depends(get_db)) -> Consumer:
@@ -56,13 +117,42 @@ async def create_user(body: UserSchema, db: AsyncSession = Depends(get_db)) -> C
         logger.log(f"Error fetching avatar for user {body.email}: {e}")
 
     new_user = Consumer(**body.model_dump(), avatar=avatar)
-    async with db as session:
-        session.add(new_user)
-        await session.commit()
-        await session.refresh(new_user)
+    db.add(new_user)
+    await db.flush()
+    await db.refresh(new_user)
     return new_user
 
 
+async def create_user_if_absent(
+    body: UserSchema, db: AsyncSession = Depends(get_db)
+) -> Optional[Consumer]:
+    """
+    Creates a new user in a single INSERT, skipping the insert on conflict.
+
+    Args:
+        body (UserSchema): The data of the user to be created.
+        db (AsyncSession, optional): The asynchronous database session.
+
+    Returns:
+        Optional[Consumer]: The created user, or None if the email is taken.
+    """
+    avatar = None
+    try:
+        g = Gravatar(body.email)
+        avatar = g.get_image()
+    except Exception as e:
+        logger.log(f"Error fetching avatar for user {body.email}: {e}")
+
+    stmt = (
+        pg_insert(Consumer)
+        .values(**body.model_dump(), avatar=avatar)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(Consumer)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
 async def update_token(user: Consumer, token: Optional[str], db: AsyncSession) -> None:
     """
     Updates the refresh token for a user in the database.
@@ -73,21 +163,40 @@ async def update_token(user: Consumer, token: Optional[str], db: AsyncSession) -
         db (AsyncSession): The asynchronous database session.
     """
     user.refresh_token = token
-    async with db as session:
-        await session.commit()
+    await db.flush()
+    await invalidate_user_cache(user.email)
 
 
-async def confirmed_email(email: str, db: AsyncSession) -> None:
+async def set_refresh_token(email: str, token: Optional[str], db: AsyncSession) -> None:
+    """
+    Stores a refresh token for a user with a single UPDATE statement.
+
+    Args:
+        email (str): The email address of the user.
+        token (str, optional): The new refresh token value, or None to clear it.
+        db (AsyncSession): The asynchronous database session.
+    """
+    stmt = update(Consumer).where(Consumer.email == email).values(refresh_token=token)
+    await db.execute(stmt)
+    await invalidate_user_cache(email)
+
+
+async def confirmed_email(email: str, db: AsyncSession) -> Consumer:
     """
     Confirms the email address of a user in the database.
 
     Args:
         email (str): The email address of the user.
         db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        Consumer: The user with the confirmed email.
     """
     user = await get_user_by_email(email, db)
     user.confirmed = True
-    await db.commit()
+    await db.flush()
+    await invalidate_user_cache(email)
+    return user
 
 
 async def update_avatar_url(
@@ -106,12 +215,13 @@ async def update_avatar_url(
     """
     user = await get_user_by_email(email, db)
     user.avatar = url
-    await db.commit()
+    await db.flush()
     await db.refresh(user)
+    await invalidate_user_cache(email)
     return user
 
 
-async def update_password(email: str, password: str, db: AsyncSession) -> None:
+async def update_password(email: str, password: str, db: AsyncSession) -> Consumer:
     """
     Updates the password of a user in the database.
 
@@ -119,7 +229,12 @@ async def update_password(email: str, password: str, db: AsyncSession) -> None:
         email (str): The email address of the user.
         password (str): The new password of the user.
         db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        Consumer: The user with the updated password.
     """
     user = await get_user_by_email(email, db)
     user.password = password
-    await db.commit()
+    await db.flush()
+    await invalidate_user_cache(email)
+    return user
@@ -1,54 +1,111 @@
 from datetime import datetime, timedelta
 from typing import Optional
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-
-
-from entity.models import User, Consumer
-from schemas.user import UserSchema
+from sqlalchemy import select, bindparam, lambda_stmt
+
+
+from src.entity.models import User, Consumer
+from src.schemas.user import UserSchema
+
+
+_GET_USERS_STMT = lambda_stmt(
+    lambda: select(User)
+    .filter_by(consumer_id=bindparam("cid"))
+    .order_by(User.id)
+    .offset(bindparam("off"))
+    .limit(bindparam("lim"))
+)
+_GET_ALL_USERS_STMT = lambda_stmt(
+    lambda: select(User)
+    .order_by(User.id)
+    .offset(bindparam("off"))
+    .limit(bindparam("lim"))
+)
+_GET_USERS_KEYSET_STMT = lambda_stmt(
+    lambda: select(User)
+    .where(User.consumer_id == bindparam("cid"), User.id > bindparam("cur"))
+    .order_by(User.id)
+    .limit(bindparam("lim"))
+)
+_GET_ALL_USERS_KEYSET_STMT = lambda_stmt(
+    lambda: select(User)
+    .where(User.id > bindparam("cur"))
+    .order_by(User.id)
+    .limit(bindparam("lim"))
+)
+_GET_USER_STMT = lambda_stmt(
+    lambda: select(User).filter_by(id=bindparam("uid"), consumer_id=bindparam("cid"))
+)
+_GET_USERS_BIRTH_STMT = lambda_stmt(
+    lambda: select(User)
+    .where(
+        User.consumer_id == bindparam("cid"),
+        User.birth_date.between(bindparam("start"), bindparam("end")),
+    )
+)
 
 
 async def get_users(
-    limit: int, offset: int, db: AsyncSession, consumer: Consumer
+    limit: int,
+    offset: int,
+    db: AsyncSession,
+    consumer: Consumer,
+    cursor: Optional[int] = None,
 ) -> list[User]:
     """
     Retrieves a list of users from the database.
 
+    When a cursor is supplied, pagination is keyset-based (id > cursor), so
+    PostgreSQL range-scans the index instead of discarding offset rows.
+
     Args:
         limit (int): The maximum number of users to retrieve.
         offset (int): The offset for pagination.
         db (AsyncSession): The asynchronous database session.
         consumer (Consumer): The consumer associated with the users.
+        cursor (int, optional): The last user id of the previous page.
 
     Returns:
         list[User]: A list of users retrieved from the database.
     """
-    search = select(User).filter_by(consumer=consumer).offset(offset).limit(limit)
-    users = await db.execute(search)
+    if cursor is not None:
+        users = await db.execute(
+            _GET_USERS_KEYSET_STMT,
+            {"cid": consumer.id, "cur": cursor, "lim": limit},
+        )
+    else:
+        users = await db.execute(
+            _GET_USERS_STMT, {"cid": consumer.id, "off": offset, "lim": limit}
+        )
     return users.scalars().all()
 
 
-async def get_all_users(limit: int, offset: int, db: AsyncSession) -> list[User]:
+async def get_all_users(
+    limit: int, offset: int, db: AsyncSession, cursor: Optional[int] = None
+) -> list[User]:
     """
     Retrieves a list of all users from the database.
 
+    When a cursor is supplied, pagination is keyset-based (id > cursor), so
+    PostgreSQL range-scans the index instead of discarding offset rows.
+
     Args:
         limit (int): The maximum number of users to retrieve.
         offset (int): The offset for pagination.
         db (AsyncSession): The asynchronous database session.
+        cursor (int, optional): The last user id of the previous page.
 
     Returns:
         list[User]: A list of users retrieved from the database.
     """
-    search = select(User).offset(offset).limit(limit)
-    users = await db.execute(search)
+    if cursor is not None:
+        users = await db.execute(
+            _GET_ALL_USERS_KEYSET_STMT, {"cur": cursor, "lim": limit}
+        )
+    else:
+        users = await db.execute(_GET_ALL_USERS_STMT, {"off": offset, "lim": limit})
     return users.scalars().all()
 
 
@@ -96,8 +153,7 @@ async def get_user(user_id: int, db: AsyncSession, consumer: Consumer) -> User:
     Returns:
         User: The user retrieved from the database.
     """
-    search = select(User).filter_by(id=user_id, consumer=consumer)
-    user = await db.execute(search)
+    user = await db.execute(_GET_USER_STMT, {"uid": user_id, "cid": consumer.id})
     return user.scalar_one_or_none()
 
 
@@ -118,10 +174,10 @@ async def get_users_birth(
     current_date = datetime.now().date()
     end_date = current_date + timedelta(days=limit)
 
-    search = select(User).filter_by(
-        User.birth_date >= current_date, User.birth_date <= end_date, consumer=consumer
+    result = await db.execute(
+        _GET_USERS_BIRTH_STMT,
+        {"start": current_date, "end": end_date, "cid": consumer.id},
     )
-    result = await db.execute(search)
 
     return result.scalars().all()
 
@@ -140,7 +196,7 @@ async def create_user(body: UserSchema, db: AsyncSession, consumer: Consumer) ->
     """
     user = User(**body.model_dump(exclude_unset=True), consumer=consumer)
     db.add(user)
-    await db.commit()
+    await db.flush()
     await db.refresh(user)
     return user
 
@@ -160,8 +216,7 @@ async def update_user(
     Returns:
         User: The user that was updated in the database.
     """
-    search = select(User).filter_by(id=user_id, consumer=consumer)
-    result = await db.execute(search)
+    result = await db.execute(_GET_USER_STMT, {"uid": user_id, "cid": consumer.id})
     user = result.scalar_one_or_none()
     if user:
         user.first_name = body.first_name
@@ -169,7 +224,7 @@ async def update_user(
         user.email_add = body.email_add
         user.phone_num = body.phone_num
         user.birth_date = body.birth_date
-        await db.commit()
+        await db.flush()
         await db.refresh(user)
     return user
 
@@ -186,10 +241,9 @@ async def delete_user(user_id: int, db: AsyncSession, consumer: Consumer) -> Use
     Returns:
         User: The user that was deleted from the database.
     """
-    search = select(User).filter_by(id=user_id, consumer=consumer)
-    user = await db.execute(search)
+    user = await db.execute(_GET_USER_STMT, {"uid": user_id, "cid": consumer.id})
     user = user.scalar_one_or_none()
     if user:
         await db.delete(user)
-        await db.commit()
+        await db.flush()
     return user
@@ -1,8 +1,4 @@
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
 
 
 from fastapi.security import (
@@ -15,17 +11,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_limiter.depends import RateLimiter
 
 
-from schemas.consumer import (
+from src.schemas.consumer import (
     UserSchema,
     TokenSchema,
-    UserResponse,
+    ConsumerResponse,
     RequestEmail,
     PasswordForm,
 )
-from services.email import send_email, send_password_email
-from repository import consumers as repository_consumer
-from services.auth import auth_service
-from database.db import get_db
+from src.services.email import send_email, send_password_email
+from src.repository import consumers as repository_consumer
+from src.services.auth import auth_service
+from src.database.db import get_db
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -35,7 +31,7 @@ get_refresh_token = HTTPBearer()
 
 
 @router.post(
-    "/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED
+    "/signup", response_model=ConsumerResponse, status_code=status.HTTP_201_CREATED
 )
 async def signup(
     body: UserSchema,
@@ -54,13 +50,14 @@ async def signup(
 
     Returns the created user.
     """
-    exist_user = await repository_consumer.get_user_by_email(body.email, db)
-    if exist_user:
+    body.password = await asyncio.to_thread(
+        auth_service.get_password_hash, body.password
+    )
+    new_user = await repository_consumer.create_user_if_absent(body, db)
+    if new_user is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Account already exists"
         )
-    body.password = auth_service.get_password_hash(body.password)
-    new_user = await repository_consumer.create_user(body, db)
     bt.add_task(send_email, new_user.email, new_user.username, str(request.base_url))
     return new_user
 
@@ -78,7 +75,7 @@ async def login(
 
     Returns access tokens.
     """
-    user = await repository_consumer.get_user_by_email(body.username, db)
+    user = await repository_consumer.get_user_by_email_cached(body.username, db)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email"
@@ -87,7 +84,9 @@ async def login(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Email not confirmed"
         )
-    if not auth_service.verify_password(body.password, user.password):
+    if not await asyncio.to_thread(
+        auth_service.verify_password, body.password, user.password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid password"
         )
@@ -96,7 +95,7 @@ async def login(
         data={"sub": user.email, "test": "Tester Testorovich"}
     )
     refresh_token = await auth_service.create_refresh_token(data={"sub": user.email})
-    await repository_consumer.update_token(user, refresh_token, db)
+    await repository_consumer.set_refresh_token(user.email, refresh_token, db)
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -124,16 +123,19 @@ async def refresh_token(
     """
     token = credentials.credentials
     email = await auth_service.decode_refresh_token(token)
-    user = await repository_consumer.get_user_by_email(email, db)
+    user = await repository_consumer.get_user_by_email_cached(email, db)
     if user.refresh_token != token:
-        await repository_consumer.update_token(user, None, db)
+        await repository_consumer.set_refresh_token(email, None, db)
+        # The 401 below rolls back get_db's request transaction, so the
+        # revocation must be committed explicitly to stick
+        await db.commit()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
         )
 
     access_token = await auth_service.create_access_token(data={"sub": email})
     refresh_token = await auth_service.create_refresh_token(data={"sub": email})
-    await repository_consumer.update_token(user, refresh_token, db)
+    await repository_consumer.set_refresh_token(email, refresh_token, db)
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -153,7 +155,7 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
     Returns a message indicating the confirmation status.
     """
     email = await auth_service.get_email_from_token(token)
-    user = await repository_consumer.get_user_by_email(email, db)
+    user = await repository_consumer.get_user_by_email_cached(email, db)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Verification error"
@@ -182,7 +184,7 @@ async def request_email(
 
     Returns a message indicating the email confirmation status.
     """
-    user = await repository_consumer.get_user_by_email(body.email, db)
+    user = await repository_consumer.get_user_by_email_cached(body.email, db)
 
     if user.confirmed:
         return {"message": "Your email is already confirmed"}
@@ -206,14 +208,14 @@ async def new_password(token: str, db: AsyncSession = Depends(get_db)):
     """
     email = await auth_service.get_email_from_token(token)
     password = await auth_service.get_password_from_token(token)
-    user = await repository_consumer.get_user_by_email(email, db)
+    user = await repository_consumer.get_user_by_email_cached(email, db)
 
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Verification error"
         )
     if password:
-        password = auth_service.get_password_hash(password)
+        password = await asyncio.to_thread(auth_service.get_password_hash, password)
         await repository_consumer.update_password(email, password, db)
     return {"message": "New password successfully updated!"}
 
@@ -238,7 +240,7 @@ async def reset_password(
 
     Returns a message indicating the status of the password reset request.
     """
-    user = await repository_consumer.get_user_by_email(body.email, db)
+    user = await repository_consumer.get_user_by_email_cached(body.email, db)
     if user:
         if body.password == body.password_confirm:
             background_tasks.add_task(
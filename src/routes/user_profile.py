@@ -1,4 +1,7 @@
-import pickle
+import asyncio
+import hashlib
+
+import orjson
 
 
 from fastapi import (
@@ -6,6 +9,8 @@ from fastapi import (
     HTTPException,
     Depends,
     status,
+    Request,
+    Response,
     UploadFile,
     File,
 )
@@ -16,11 +21,11 @@ import cloudinary
 
 
 from src.repository import consumers as repository_consumer
-from schemas.consumer import UserResponse
-from services.auth import auth_service
-from entity.models import Consumer
-from database.db import get_db
-from config.conf import config
+from src.schemas.consumer import ConsumerResponse
+from src.services.auth import auth_service, consumer_to_mapping
+from src.entity.models import Consumer
+from src.database.db import get_db
+from src.config.conf import config
 
 
 router = APIRouter(prefix="/users-profile", tags=["users-profile"])
@@ -36,16 +41,42 @@ cloudinary.config(
 
 @router.get(
     "/me",
-    response_model=UserResponse,
+    response_model=ConsumerResponse,
     dependencies=[Depends(RateLimiter(times=2, seconds=10))],
 )
-async def get_current_user(user: Consumer = Depends(auth_service.get_current_user)):
+async def get_current_user(
+    request: Request,
+    response: Response,
+    user: Consumer = Depends(auth_service.get_current_user),
+):
+    """
+    Returns the current user's profile, honouring If-None-Match.
+
+    A weak ETag is derived from the public consumer fields; when the
+    client presents a matching If-None-Match header the body is skipped
+    and 304 Not Modified is returned instead.
+
+    Args:
+        request (Request): The incoming request.
+        response (Response): The outgoing response carrying the ETag.
+        user (Consumer): The current authenticated consumer.
+
+    Returns:
+        Consumer: The current consumer, or an empty 304 response.
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(consumer_to_mapping(user)), digest_size=16
+    ).hexdigest()
+    etag = f'W/"{digest}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
     return user
 
 
 @router.patch(
     "/avatar",
-    response_model=UserResponse,
+    response_model=ConsumerResponse,
     dependencies=[Depends(RateLimiter(times=2, seconds=10))],
 )
 async def update_avatar(
@@ -55,13 +86,22 @@ async def update_avatar(
 ):
     try:
         public_id = f"Web16/{user.email}"
-        res = cloudinary.uploader.upload(file.file, public_id=public_id, overwrite=True)
+        res = await asyncio.to_thread(
+            cloudinary.uploader.upload_large,
+            file.file,
+            public_id=public_id,
+            overwrite=True,
+            chunk_size=6_000_000,
+            resource_type="image",
+        )
         res_url = cloudinary.CloudinaryImage(public_id).build_url(
             width=250, height=250, crop="fill", version=res.get("version")
         )
         user = await repository_consumer.update_avatar_url(user.email, res_url, db)
-        auth_service.cache.set(user.email, pickle.dumps(user))
-        auth_service.cache.expire(user.email, 300)
+        pipe = auth_service.cache.pipeline()
+        pipe.hset(user.email, mapping=consumer_to_mapping(user))
+        pipe.expire(user.email, 300)
+        await pipe.execute()
         return user
     except Exception as e:
         raise HTTPException(
@@ -1,22 +1,18 @@
-from typing import List
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
+from typing import Callable, List
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_limiter.depends import RateLimiter
 
 
-from schemas.user import UserSchema, UserResponse
-from repository import users as repository_users
-from entity.models import Consumer, Role
-from services.auth import auth_service
-from services.roles import RoleAccess
-from database.db import get_db
+from src.database.db import get_db, get_session_factory
+from src.schemas.user import UserSchema, UserResponse
+from src.repository import users as repository_users
+from src.entity.models import Consumer, Role
+from src.services.auth import auth_service
+from src.services.roles import RoleAccess
 
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -25,10 +21,18 @@ router = APIRouter(prefix="/users", tags=["users"])
 access_to_route_all = RoleAccess([Role.ADMIN, Role.MODERATOR])
 
 
+BULK_PAGE_SIZE = 100
+bulk_db_semaphore = asyncio.Semaphore(5)
+
+
+user_list_adapter = TypeAdapter(List[UserResponse])
+
+
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
-    limit: int = Query(10, ge=10, le=500),
+    limit: int = Query(10, ge=10, le=100),
     offset: int = Query(0, ge=0),
+    cursor: int = Query(None, ge=1, description="Last user id of the previous page"),
     db: AsyncSession = Depends(get_db),
     c_user: Consumer = Depends(auth_service.get_current_user),
 ) -> List[UserResponse]:
@@ -38,14 +42,17 @@ async def get_users(
     Args:
         limit (int): The maximum number of users to retrieve.
         offset (int): The offset for pagination.
+        cursor (int, optional): The last user id of the previous page; when
+            given, keyset pagination is used instead of the offset.
         db (AsyncSession): The asynchronous database session.
         c_user (Consumer): The consumer associated with the users.
 
     Returns:
         List[UserResponse]: A list of users retrieved from the database.
     """
-    users = await repository_users.get_users(limit, offset, db, c_user)
-    return users
+    users = await repository_users.get_users(limit, offset, db, c_user, cursor)
+    validated = user_list_adapter.validate_python(users, from_attributes=True)
+    return ORJSONResponse(user_list_adapter.dump_python(validated, mode="json"))
 
 
 @router.get(
@@ -54,8 +61,9 @@ async def get_users(
     dependencies=[Depends(access_to_route_all)],
 )
 async def get_all_users(
-    limit: int = Query(10, ge=10, le=500),
+    limit: int = Query(10, ge=10, le=100),
     offset: int = Query(0, ge=0),
+    cursor: int = Query(None, ge=1, description="Last user id of the previous page"),
     db: AsyncSession = Depends(get_db),
 ) -> List[UserResponse]:
     """
@@ -64,13 +72,16 @@ async def get_all_users(
     Args:
         limit (int): The maximum number of users to retrieve.
         offset (int): The offset for pagination.
+        cursor (int, optional): The last user id of the previous page; when
+            given, keyset pagination is used instead of the offset.
         db (AsyncSession): The asynchronous database session.
 
     Returns:
         List[UserResponse]: A list of users retrieved from the database.
     """
-    users = await repository_users.get_all_users(limit, offset, db)
-    return users
+    users = await repository_users.get_all_users(limit, offset, db, cursor)
+    validated = user_list_adapter.validate_python(users, from_attributes=True)
+    return ORJSONResponse(user_list_adapter.dump_python(validated, mode="json"))
 
 
 @router.get("/birth_date", response_model=List[UserResponse])
@@ -123,6 +134,41 @@ async def get_users_by(
     return users
 
 
+@router.get("/bulk", response_model=List[UserResponse])
+async def get_users_bulk(
+    count: int = Query(100, ge=1, le=1000),
+    c_user: Consumer = Depends(auth_service.get_current_user),
+    session_factory: Callable = Depends(get_session_factory),
+) -> List[UserResponse]:
+    """
+    Retrieves up to ``count`` users by fetching pages concurrently.
+
+    Pages of ``BULK_PAGE_SIZE`` users are loaded in parallel, each on its
+    own database session, with a semaphore capping database concurrency.
+
+    Args:
+        count (int): The total number of users to retrieve.
+        c_user (Consumer): The consumer associated with the users.
+        session_factory (Callable): The factory opening one session per page.
+
+    Returns:
+        List[UserResponse]: A list of users retrieved from the database.
+    """
+
+    async def fetch_page(offset: int) -> List[UserResponse]:
+        async with bulk_db_semaphore:
+            async with session_factory() as session:
+                limit = min(BULK_PAGE_SIZE, count - offset)
+                return await repository_users.get_users(limit, offset, session, c_user)
+
+    pages = await asyncio.gather(
+        *(fetch_page(offset) for offset in range(0, count, BULK_PAGE_SIZE))
+    )
+    users = [user for page in pages for user in page]
+    validated = user_list_adapter.validate_python(users, from_attributes=True)
+    return ORJSONResponse(user_list_adapter.dump_python(validated, mode="json"))
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int = Path(ge=1),
@@ -215,4 +261,6 @@ async def delete_user(
         UserResponse: The user that was deleted from the database.
     """
     user = await repository_users.delete_user(user_id, db, c_user)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NOT FOUND")
     return user
@@ -1,14 +1,7 @@
-import sys
-import os
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
-from pydantic import BaseModel, EmailStr, Field
-
-
-from entity.models import Role
+from src.entity.models import Role
 
 
 class UserSchema(BaseModel):
@@ -21,23 +14,18 @@ class UserSchema(BaseModel):
     password: str = Field(min_length=6, max_length=30, description="Password")
 
 
-class UserResponse(BaseModel):
+class ConsumerResponse(BaseModel):
     """
-    Data schema for user response.
+    Data schema for consumer response.
     """
 
     id: int = Field(description="User identifier")
     username: str = Field(description="Username")
     email: EmailStr = Field(description="Email address")
-    avatar: str = Field(default=None, description="URL of user's avatar")
+    avatar: str | None = Field(default=None, description="URL of user's avatar")
     role: Role = Field(description="User's role")
 
-    class Config:
-        """
-        Configuration for UserResponse schema.
-        """
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenSchema(BaseModel):
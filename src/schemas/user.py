@@ -1,15 +1,8 @@
 from datetime import date, datetime
-import sys
-import os
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
-from pydantic import BaseModel, EmailStr, Field
-
-
-from schemas.consumer import UserResponse
+from src.schemas.consumer import ConsumerResponse
 
 
 class UserSchema(BaseModel):
@@ -39,13 +32,8 @@ class UserResponse(BaseModel):
     email_add: EmailStr = Field(description="Email address of the user")
     phone_num: str = Field(description="Phone number of the user")
     birth_date: date = Field(description="Birth date of the user")
-    consumer: UserResponse | None = Field(description="Related consumer data")
+    consumer: ConsumerResponse | None = Field(description="Related consumer data")
     created_at: datetime = Field(description="Creation timestamp of the user")
     updated_at: datetime = Field(description="Update timestamp of the user")
 
-    class Config:
-        """
-        Configuration class for UserResponse.
-        """
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,25 +1,110 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-import pickle
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
+import hashlib
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from passlib.context import CryptContext
-from jose import JWTError, jwt
-import redis
+from jose import JWTError, jwk, jwt
+import orjson
+
+
+from src.repository.consumers import get_user_by_email
+from src.customs.custom_logger import logger
+from src.entity.models import Consumer, Role
+from src.database.cache import get_redis
+from src.database.db import get_db
+from src.config.conf import config
+
+
+def serialize_consumer(user: Consumer) -> bytes:
+    """
+    Packs the cache-relevant Consumer fields into a compact JSON payload.
+
+    Args:
+        user (Consumer): The consumer to serialize.
+
+    Returns:
+        bytes: The orjson-encoded field dict.
+    """
+    return orjson.dumps(
+        {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "password": user.password,
+            "avatar": user.avatar,
+            "refresh_token": user.refresh_token,
+            "role": user.role.value if user.role is not None else None,
+            "confirmed": user.confirmed,
+        }
+    )
+
 
+def deserialize_consumer(data: bytes) -> Consumer:
+    """
+    Rebuilds a detached Consumer instance from a cached payload.
+
+    Args:
+        data (bytes): The orjson-encoded field dict.
 
-from repository.consumers import get_user_by_email
-from customs.custom_logger import logger
-from database.db import get_db
-from config.conf import config
+    Returns:
+        Consumer: The reconstructed consumer.
+    """
+    fields = orjson.loads(data)
+    if fields.get("role") is not None:
+        fields["role"] = Role(fields["role"])
+    return Consumer(**fields)
+
+
+def consumer_to_mapping(user: Consumer) -> dict:
+    """
+    Flattens the cache-relevant Consumer fields into a Redis hash mapping.
+
+    Args:
+        user (Consumer): The consumer to flatten.
+
+    Returns:
+        dict: String field/value pairs suitable for HSET.
+    """
+    return {
+        "id": str(user.id),
+        "username": user.username,
+        "email": user.email,
+        "avatar": user.avatar or "",
+        "role": user.role.value if user.role is not None else "",
+        "confirmed": "1" if user.confirmed else "0",
+    }
+
+
+def consumer_from_mapping(mapping: dict) -> Optional[Consumer]:
+    """
+    Rebuilds a detached Consumer instance from a Redis hash mapping.
+
+    Args:
+        mapping (dict): The field/value pairs returned by HGETALL.
+
+    Returns:
+        Optional[Consumer]: The reconstructed consumer, or None for an
+        empty mapping.
+    """
+    if not mapping:
+        return None
+    fields = {
+        key.decode() if isinstance(key, bytes) else key: (
+            value.decode() if isinstance(value, bytes) else value
+        )
+        for key, value in mapping.items()
+    }
+    return Consumer(
+        id=int(fields["id"]),
+        username=fields["username"],
+        email=fields["email"],
+        avatar=fields["avatar"] or None,
+        role=Role(fields["role"]) if fields["role"] else None,
+        confirmed=fields["confirmed"] == "1",
+    )
 
 
 class Auth:
@@ -27,15 +112,22 @@ class Auth:
     Class for user authentication and authorization.
     """
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated=["bcrypt"],
+        argon2__time_cost=2,
+        argon2__memory_cost=19456,
+        argon2__parallelism=1,
+    )
     SECRET_KEY = config.SECRET_KEY_JWT
     ALGORITHM = config.ALGORITHM
-    cache = redis.Redis(
-        host=config.REDIS_DOMAIN,
-        port=config.REDIS_PORT,
-        db=0,
-        password=config.REDIS_PASSWORD,
-    )
+    SIGNING_KEY = jwk.construct(config.SECRET_KEY_JWT.encode(), config.ALGORITHM)
+    ACCESS_TOKEN_DELTA = timedelta(minutes=15)
+    REFRESH_TOKEN_DELTA = timedelta(days=7)
+    EMAIL_TOKEN_DELTA = timedelta(days=1)
+    JWT_CACHE_MAX = 1024
+    _jwt_cache: dict = {}
+    cache = get_redis()
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -78,15 +170,14 @@ class Auth:
             str: The encoded access token.
         """
         to_encode = data.copy()
+        now = datetime.now(timezone.utc)
         if expires_delta:
-            expire = datetime.now(timezone.utc) + timedelta(seconds=expires_delta)
+            expire = now + timedelta(seconds=expires_delta)
         else:
-            expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-        to_encode.update(
-            {"iat": datetime.now(timezone.utc), "exp": expire, "scope": "access_token"}
-        )
+            expire = now + self.ACCESS_TOKEN_DELTA
+        to_encode.update({"iat": now, "exp": expire, "scope": "access_token"})
         encoded_access_token = jwt.encode(
-            to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM
+            to_encode, self.SIGNING_KEY, algorithm=self.ALGORITHM
         )
         return encoded_access_token
 
@@ -104,15 +195,14 @@ class Auth:
             str: The encoded refresh token.
         """
         to_encode = data.copy()
+        now = datetime.now(timezone.utc)
         if expires_delta:
-            expire = datetime.now(timezone.utc) + timedelta(seconds=expires_delta)
+            expire = now + timedelta(seconds=expires_delta)
         else:
-            expire = datetime.now(timezone.utc) + timedelta(days=7)
-        to_encode.update(
-            {"iat": datetime.now(timezone.utc), "exp": expire, "scope": "refresh_token"}
-        )
+            expire = now + self.REFRESH_TOKEN_DELTA
+        to_encode.update({"iat": now, "exp": expire, "scope": "refresh_token"})
         encoded_refresh_token = jwt.encode(
-            to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM
+            to_encode, self.SIGNING_KEY, algorithm=self.ALGORITHM
         )
         return encoded_refresh_token
 
@@ -131,7 +221,7 @@ class Auth:
         """
         try:
             payload = jwt.decode(
-                refresh_token, self.SECRET_KEY, algorithms=[self.ALGORITHM]
+                refresh_token, self.SIGNING_KEY, algorithms=[self.ALGORITHM]
             )
             if payload["scope"] == "refresh_token":
                 email = payload["sub"]
@@ -168,20 +258,63 @@ class Auth:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-        try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
-            if payload["scope"] == "access_token":
-                email = payload["sub"]
-                if email is None:
-                    raise credentials_exception
-            else:
+        jwt_key = "jwt:" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        now = time.time()
+        payload = None
+        local_entry = self._jwt_cache.get(jwt_key)
+        if local_entry is not None and local_entry[0] > now:
+            payload = local_entry[1]
+
+        if payload is None:
+            try:
+                cached_payload = await self.cache.get(jwt_key)
+                if cached_payload is not None:
+                    payload = orjson.loads(cached_payload)
+            except Exception as err:
+                logger.log(err, level=40)
+
+        if payload is None:
+            try:
+                payload = jwt.decode(
+                    token, self.SIGNING_KEY, algorithms=[self.ALGORITHM]
+                )
+            except JWTError as e:
                 raise credentials_exception
-        except JWTError as e:
+            try:
+                ttl = max(1, int(payload["exp"]) - int(now))
+                await self.cache.set(jwt_key, orjson.dumps(payload), ex=ttl)
+            except Exception as err:
+                logger.log(err, level=40)
+
+        if local_entry is None or local_entry[0] <= now:
+            if len(self._jwt_cache) >= self.JWT_CACHE_MAX:
+                self._jwt_cache.clear()
+            self._jwt_cache[jwt_key] = (float(payload.get("exp", now)), payload)
+
+        if payload.get("scope") == "access_token":
+            email = payload.get("sub")
+            if email is None:
+                raise credentials_exception
+        else:
             raise credentials_exception
 
+        try:
+            cached = consumer_from_mapping(await self.cache.hgetall(email))
+            if cached is not None:
+                return cached
+        except Exception as err:
+            logger.log(err, level=40)
+
         user = await get_user_by_email(email, db)
         if user is None:
             raise credentials_exception
+        try:
+            pipe = self.cache.pipeline()
+            pipe.hset(email, mapping=consumer_to_mapping(user))
+            pipe.expire(email, 300)
+            await pipe.execute()
+        except Exception as err:
+            logger.log(err, level=40)
         return user
 
     def create_email_token(self, data: dict) -> str:
@@ -195,9 +328,9 @@ class Auth:
             str: The encoded JWT token.
         """
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + timedelta(days=1)
-        to_encode.update({"iat": datetime.now(timezone.utc), "exp": expire})
-        token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        now = datetime.now(timezone.utc)
+        to_encode.update({"iat": now, "exp": now + self.EMAIL_TOKEN_DELTA})
+        token = jwt.encode(to_encode, self.SIGNING_KEY, algorithm=self.ALGORITHM)
         return token
 
     async def get_email_from_token(self, token: str) -> str:
@@ -214,7 +347,7 @@ class Auth:
             HTTPException: If the token is invalid for email verification.
         """
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(token, self.SIGNING_KEY, algorithms=[self.ALGORITHM])
             email = payload["sub"]
             return email
         except JWTError as e:
@@ -238,7 +371,7 @@ class Auth:
             HTTPException: If the token is invalid for password verification.
         """
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = jwt.decode(token, self.SIGNING_KEY, algorithms=[self.ALGORITHM])
             password = payload["password"]
             return password
         except JWTError as e:
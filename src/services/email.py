@@ -1,20 +1,13 @@
 from typing import Awaitable
 from pathlib import Path
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
 from pydantic import EmailStr
 
 
-from customs.custom_logger import logger
-from services.auth import auth_service
-from config.conf import config
+from src.customs.custom_logger import logger
+from src.services.auth import auth_service
+from src.config.conf import config
 
 
 conf = ConnectionConfig(
@@ -32,6 +25,9 @@ conf = ConnectionConfig(
 )
 
 
+fm = FastMail(conf)
+
+
 async def send_email(email: EmailStr, username: str, host: str) -> Awaitable[None]:
     """
     Sends an email for email address confirmation.
@@ -56,7 +52,6 @@ async def send_email(email: EmailStr, username: str, host: str) -> Awaitable[Non
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="verify_email.html")
     except ConnectionErrors as e:
         logger.log(e, level=40)
@@ -92,7 +87,6 @@ async def send_password_email(
             subtype=MessageType.html,
         )
 
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="password_form.html")
     except ConnectionErrors as e:
         logger.log(e, level=40)
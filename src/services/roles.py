@@ -1,15 +1,8 @@
-import sys
-import os
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
 from fastapi import Request, Depends, HTTPException, status
 
 
-from services.auth import auth_service
-from entity.models import Role, User
+from src.services.auth import auth_service
+from src.entity.models import Role, User
 
 
 class RoleAccess:
@@ -21,7 +14,7 @@ class RoleAccess:
     """
 
     def __init__(self, allowed_roles: list[Role]):
-        self.allowed_roles = allowed_roles
+        self.allowed_roles = frozenset(allowed_roles)
 
     async def __call__(
         self, request: Request, user: User = Depends(auth_service.get_current_user)
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+import uvloop
+
+from src.repository import consumers as repository_consumer
+from src.services.auth import auth_service
+
+
+# Run every asyncio-based test on uvloop, matching the production loop;
+# pytest-asyncio builds its session-scoped loop via the policy
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+class StubRedisPipeline:
+    """Companion pipeline stub that queues nothing and executes to nothing."""
+
+    def hset(self, *args, **kwargs):
+        return self
+
+    def expire(self, *args, **kwargs):
+        return self
+
+    async def execute(self):
+        return []
+
+
+class StubRedisCache:
+    """Hand-rolled async cache stub where every lookup misses."""
+
+    def pipeline(self, *args, **kwargs):
+        return StubRedisPipeline()
+
+    async def get(self, *args, **kwargs):
+        return None
+
+    async def set(self, *args, **kwargs):
+        return None
+
+    async def hgetall(self, *args, **kwargs):
+        return {}
+
+    async def hset(self, *args, **kwargs):
+        return 0
+
+    async def expire(self, *args, **kwargs):
+        return True
+
+    async def delete(self, *args, **kwargs):
+        return 0
+
+
+# Fixture replacing every Redis client with a miss-everything stub
+@pytest.fixture(autouse=True)
+def _disable_auth_cache() -> StubRedisCache:
+    """Fixture swapping both Redis clients for the stub without patch machinery."""
+    saved_cache = auth_service.cache
+    saved_get_redis = repository_consumer.get_redis
+    stub = StubRedisCache()
+    auth_service.cache = stub
+    repository_consumer.get_redis = lambda: stub
+    yield stub
+    auth_service.cache = saved_cache
+    repository_consumer.get_redis = saved_get_redis
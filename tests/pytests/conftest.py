@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fastapi import Request, Response
+from fastapi_limiter.depends import RateLimiter
+from passlib.context import CryptContext
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.services.auth import auth_service
+
+# Re-export the shared fixtures so every test module can use them
+from tests.pytests.conf_test import (  # noqa: F401
+    client,
+    get_token,
+    init_models_wrap,
+    test_user,
+)
+
+
+# Synchronous engine over the same shared in-memory SQLite database
+SYNC_DATABASE_URL = "sqlite:///file:test_db?mode=memory&cache=shared&uri=true"
+
+sync_engine = create_engine(
+    SYNC_DATABASE_URL,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
+)
+SyncSessionLocal = scoped_session(sessionmaker(bind=sync_engine, autoflush=False))
+
+
+# Fixture disabling the rate limiter, which needs a live Redis backend
+@pytest.fixture(scope="session", autouse=True)
+def _disable_rate_limiter():
+    """Fixture turning RateLimiter dependencies into no-ops for tests."""
+
+    async def _noop(self, request: Request, response: Response) -> None:
+        return None
+
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(RateLimiter, "__call__", _noop)
+    yield
+    patcher.undo()
+
+
+# Fixture installing one shared send_email mock for the whole test run
+@pytest.fixture(scope="session", autouse=True)
+def mock_send_email() -> AsyncMock:
+    """Fixture replacing send_email with a single shared AsyncMock."""
+    patcher = pytest.MonkeyPatch()
+    mock = AsyncMock()
+    patcher.setattr("src.routes.auth.send_email", mock)
+    yield mock
+    patcher.undo()
+
+
+# Fixture lowering the password-hash work factor for the whole test run
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing():
+    """Fixture swapping in a minimal-cost hasher for signup/login tests."""
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(
+        auth_service, "pwd_context", CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    )
+    yield
+    patcher.undo()
+
+
+# Fixture with signup data shared across a test module
+@pytest.fixture(scope="module")
+def user() -> dict:
+    """Fixture with the signup payload reused by a whole test module."""
+    return {
+        "username": "agent007",
+        "email": "Vladislavovich@agent007.com",
+        "password": "vlados",
+    }
+
+
+# Fixture for a synchronous session shared across a test module
+@pytest.fixture(scope="module")
+def session():
+    """Fixture yielding the scoped synchronous session per test module."""
+    yield SyncSessionLocal()
+    SyncSessionLocal.remove()
@@ -1,18 +1,13 @@
-from unittest.mock import Mock
 from typing import Any
-import sys
-import os
 
-from sqlalchemy import select
+from pytest import Session
+from sqlalchemy import update
 import pytest
 
 
-from tests.pytests.conf_test import postgresql_session
 from src.entity.models import Consumer
 
 
-# Add the project's root directory path to sys.path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 user_data: dict[str, str] = {
     "username": "agent007",
     "email": "Vladislavovich@agent007.com",
@@ -20,11 +15,10 @@ user_data: dict[str, str] = {
 }
 
 
-def test_signup(client: Any, monkeypatch: Any) -> None:
+@pytest.mark.asyncio
+async def test_signup(client: Any) -> None:
     """Test signing up."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("source.routes.auth.send_email", mock_send_email)
-    response = client.post("api/auth/signup", json=user_data)
+    response = await client.post("api/auth/signup", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
     assert data["username"] == user_data["username"]
@@ -33,19 +27,19 @@ def test_signup(client: Any, monkeypatch: Any) -> None:
     assert "avatar" in data
 
 
-def test_repeat_signup(client: Any, monkeypatch: Any) -> None:
+@pytest.mark.asyncio
+async def test_repeat_signup(client: Any) -> None:
     """Test repeating signup."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("source.routes.auth.send_email", mock_send_email)
-    response = client.post("api/auth/signup", json=user_data)
+    response = await client.post("api/auth/signup", json=user_data)
     assert response.status_code == 409, response.text
     data = response.json()
     assert data["detail"] == "Account already exists"
 
 
-def test_not_confirmed_login(client: Any) -> None:
+@pytest.mark.asyncio
+async def test_not_confirmed_login(client: Any) -> None:
     """Test login with unconfirmed email."""
-    response = client.post(
+    response = await client.post(
         "api/auth/login",
         data={
             "username": user_data.get("email"),
@@ -58,18 +52,16 @@ def test_not_confirmed_login(client: Any) -> None:
 
 
 @pytest.mark.asyncio
-async def test_login(client: Any) -> None:
+async def test_login(client: Any, session: Session) -> None:
     """Test login."""
-    async with postgresql_session() as session:
-        current_user = await session.execute(
-            select(Consumer).where(Consumer.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
-
-    response = client.post(
+    session.execute(
+        update(Consumer)
+        .where(Consumer.email == user_data.get("email"))
+        .values(confirmed=True)
+    )
+    session.commit()
+
+    response = await client.post(
         "api/auth/login",
         data={
             "username": user_data.get("email"),
@@ -83,9 +75,10 @@ async def test_login(client: Any) -> None:
     assert "token_type" in data
 
 
-def test_wrong_password_login(client: Any) -> None:
+@pytest.mark.asyncio
+async def test_wrong_password_login(client: Any) -> None:
     """Test login with wrong password."""
-    response = client.post(
+    response = await client.post(
         "api/auth/login",
         data={"username": user_data.get("email"), "password": "password"},
     )
@@ -1,28 +1,29 @@
-from unittest.mock import AsyncMock
 from pytest import Session
-from typing import Any
 
+import pytest
+
+from httpx import AsyncClient
+from sqlalchemy import update
 
-from fastapi.testclient import TestClient
 from src.entity.models import Consumer
 
 
-def test_create_user(client: TestClient, user: dict[str, str], monkeypatch: Any) -> None:
+@pytest.mark.asyncio
+async def test_create_user(client: AsyncClient, user: dict[str, str]) -> None:
     """Test creating a user."""
-    mock_send_email = AsyncMock()
-    monkeypatch.setattr("source.routes.auth.send_email", mock_send_email)
-    response = client.post(
+    response = await client.post(
         "/api/auth/signup",
         json=user,
     )
     assert response.status_code == 201, response.text
     data = response.json()
-    assert data["user"]["email"] == user.get("email")
-    assert "id" in data["user"]
+    assert data["email"] == user.get("email")
+    assert "id" in data
 
-def test_repeat_create_user(client: TestClient, user: dict[str, str]) -> None:
+@pytest.mark.asyncio
+async def test_repeat_create_user(client: AsyncClient, user: dict[str, str]) -> None:
     """Test repeating creating a user."""
-    response = client.post(
+    response = await client.post(
         "/api/auth/signup",
         json=user,
     )
@@ -30,9 +31,10 @@ def test_repeat_create_user(client: TestClient, user: dict[str, str]) -> None:
     data = response.json()
     assert data["detail"] == "Account already exists"
 
-def test_login_user_not_confirmed(client: TestClient, user: dict[str, str]) -> None:
+@pytest.mark.asyncio
+async def test_login_user_not_confirmed(client: AsyncClient, user: dict[str, str]) -> None:
     """Test login with unconfirmed email."""
-    response = client.post(
+    response = await client.post(
         "/api/auth/login",
         data={"username": user.get("email"), "password": user.get("password")},
     )
@@ -40,14 +42,16 @@ def test_login_user_not_confirmed(client: TestClient, user: dict[str, str]) -> N
     data = response.json()
     assert data["detail"] == "Email not confirmed"
 
-def test_login_user(client: TestClient, session: Session, user: dict[str, str]) -> None:
+@pytest.mark.asyncio
+async def test_login_user(client: AsyncClient, session: Session, user: dict[str, str]) -> None:
     """Test login."""
-    current_user: Consumer = (
-        session.query(Consumer).filter(Consumer.email == user.get("email")).first()
+    session.execute(
+        update(Consumer)
+        .where(Consumer.email == user.get("email"))
+        .values(confirmed=True)
     )
-    current_user.confirmed = True
     session.commit()
-    response = client.post(
+    response = await client.post(
         "/api/auth/login",
         data={"username": user.get("email"), "password": user.get("password")},
     )
@@ -55,9 +59,10 @@ def test_login_user(client: TestClient, session: Session, user: dict[str, str])
     data = response.json()
     assert data["token_type"] == "bearer"
 
-def test_login_wrong_password(client: TestClient, user: dict[str, str]) -> None:
+@pytest.mark.asyncio
+async def test_login_wrong_password(client: AsyncClient, user: dict[str, str]) -> None:
     """Test login with wrong password."""
-    response = client.post(
+    response = await client.post(
         "/api/auth/login",
         data={"username": user.get("email"), "password": "password"},
     )
@@ -65,13 +70,13 @@ def test_login_wrong_password(client: TestClient, user: dict[str, str]) -> None:
     data = response.json()
     assert data["detail"] == "Invalid password"
 
-def test_login_wrong_email(client: TestClient, user: dict[str, str]) -> None:
+@pytest.mark.asyncio
+async def test_login_wrong_email(client: AsyncClient, user: dict[str, str]) -> None:
     """Test login with wrong email."""
-    response = client.post(
+    response = await client.post(
         "/api/auth/login",
         data={"username": "email", "password": user.get("password")},
     )
     assert response.status_code == 401, response.text
     data = response.json()
     assert data["detail"] == "Invalid email"
-    
\ No newline at end of file
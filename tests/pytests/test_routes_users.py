@@ -1,149 +1,99 @@
-from unittest.mock import patch, AsyncMock
 from datetime import datetime, timedelta
-from typing import Any
 
-
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 import pytest
+import pytest_asyncio
 
-
+from tests.pytests.conf_test import test_user
 from src.services.auth import auth_service
-from src.entity.models import User
 
 
-@pytest.fixture()
-def token(client: TestClient, user: dict[str, str], session: pytest.Session, monkeypatch: Any) -> str:
-    """Fixture to get an access token."""
-    mock_send_email = AsyncMock()
-    monkeypatch.setattr("source.routes.auth.send_email", mock_send_email)
-    client.post("/api/auth/signup", json=user)
-    current_user: User = (
-        session.query(User).filter(User.email == user.get("email")).first()
+TODAY = datetime.now().date()
+
+CREATE_USER_PAYLOAD = {
+    "first_name": "John",
+    "second_name": "Doe",
+    "email_add": "john.doe@example.com",
+    "phone_num": "1234567890",
+    "birth_date": (TODAY - timedelta(days=1245)).isoformat(),
+}
+
+UPDATE_USER_PAYLOAD = {
+    "first_name": "Jane",
+    "second_name": "Doe",
+    "email_add": "jane.doe@example.com",
+    "phone_num": "9876543210",
+    "birth_date": (TODAY - timedelta(days=124)).isoformat(),
+}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def token() -> str:
+    """Fixture minting a token for the seeded consumer without HTTP calls."""
+    return await auth_service.create_access_token(data={"sub": test_user["email"]})
+
+
+@pytest.mark.asyncio
+async def test_user_crud_flow(client: AsyncClient, token: str) -> None:
+    """Test the full create/read/update/delete flow for users."""
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.post(
+        "/api/users",
+        json=CREATE_USER_PAYLOAD,
+        headers=headers,
     )
-    current_user.confirmed = True
-    session.commit()
-    response = client.post(
-        "/api/auth/login",
-        data={"username": user.get("email"), "password": user.get("password")},
+    assert response.status_code == 201, response.text
+    data = response.json()
+    assert data["second_name"] == "Doe"
+    assert "id" in data
+
+    response = await client.get("/api/users/1", headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["second_name"] == "Doe"
+    assert "id" in data
+
+    response = await client.get("/api/users/2", headers=headers)
+    assert response.status_code == 404, response.text
+    assert response.json()["detail"] == "NOT FOUND"
+
+    response = await client.get("/api/users", headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert isinstance(data, list)
+    assert data[0]["first_name"] == "John"
+    assert "id" in data[0]
+
+    response = await client.get("/api/users/bulk?count=200", headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert [item["first_name"] for item in data] == ["John"]
+
+    response = await client.put(
+        "/api/users/1",
+        json=UPDATE_USER_PAYLOAD,
+        headers=headers,
     )
+    assert response.status_code == 200, response.text
     data = response.json()
-    return data["access_token"]
-
-def test_create_user(client: TestClient, token: str) -> None:
-    """Test creating a user."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.post(
-            "/api/users",
-            json={
-                "first_name": "John",
-                "second_name": "Doe",
-                "email_add": "john.doe@example.com",
-                "phone_num": "1234567890",
-                "birth_date": datetime.now().date() - timedelta(days=1245),
-            },
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        assert response.status_code == 201, response.text
-        data = response.json()
-        assert data["second_name"] == "Doe"
-        assert "id" in data
-
-def test_get_user(client: TestClient, token: str) -> None:
-    """Test getting a user."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.get(
-            "/api/users/1", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert data["second_name"] == "Doe"
-        assert "id" in data
-
-def test_get_user_not_found(client: TestClient, token: str) -> None:
-    """Test getting a non-existent user."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.get(
-            "/api/users/2", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code == 404, response.text
-        data = response.json()
-        assert data["detail"] == "NOT FOUND"
-
-def test_get_users(client: TestClient, token: str) -> None:
-    """Test getting users."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.get(
-            "/api/users", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert isinstance(data, list)
-        assert data[0]["first_name"] == "John"
-        assert "id" in data[0]
-
-def test_update_user(client: TestClient, token: str) -> None:
-    """Test updating a user."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.put(
-            "/api/users/1",
-            json={
-                "first_name": "Jane",
-                "second_name": "Doe",
-                "email_add": "jane.doe@example.com",
-                "phone_num": "9876543210",
-                "birth_date": datetime.now().date() - timedelta(days=124),
-            },
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert data["first_name"] == "Jane"
-        assert "id" in data
-
-def test_update_user_not_found(client: TestClient, token: str) -> None:
-    """Test updating a non-existent user."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.put(
-            "/api/users/2",
-            json={
-                "first_name": "Jane",
-                "second_name": "Doe",
-                "email_add": "jane.doe@example.com",
-                "phone_num": "9876543210",
-                "birth_date": datetime.now().date() - timedelta(days=124),
-            },
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        assert response.status_code == 404, response.text
-        data = response.json()
-        assert data["detail"] == "NOT FOUND"
-
-def test_delete_user(client: TestClient, token: str) -> None:
-    """Test deleting a user."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.delete(
-            "/api/users/1", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code == 200, response.text
-        data = response.json()
-        assert data["first_name"] == "Jane"
-        assert "id" in data
-
-def test_repeat_delete_user(client: TestClient, token: str) -> None:
-    """Test deleting a non-existent user."""
-    with patch.object(auth_service, "r") as r_mock:
-        r_mock.get.return_value = None
-        response = client.delete(
-            "/api/users/1", headers={"Authorization": f"Bearer {token}"}
-        )
-        assert response.status_code == 404, response.text
-        data = response.json()
-        assert data["detail"] == "NOT FOUND"
-        
\ No newline at end of file
+    assert data["first_name"] == "Jane"
+    assert "id" in data
+
+    response = await client.put(
+        "/api/users/2",
+        json=UPDATE_USER_PAYLOAD,
+        headers=headers,
+    )
+    assert response.status_code == 404, response.text
+    assert response.json()["detail"] == "NOT FOUND"
+
+    response = await client.delete("/api/users/1", headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["first_name"] == "Jane"
+    assert "id" in data
+
+    response = await client.delete("/api/users/1", headers=headers)
+    assert response.status_code == 404, response.text
+    assert response.json()["detail"] == "NOT FOUND"